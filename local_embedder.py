@@ -0,0 +1,51 @@
+from typing import Optional
+
+import numpy as np
+import streamlit as st
+from optimum.onnxruntime import ORTModelForFeatureExtraction
+from transformers import AutoTokenizer
+
+from embedchain.config.embedder.base import BaseEmbedderConfig
+from embedchain.embedder.base import BaseEmbedder
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+
+
+@st.cache_resource
+def _load_onnx_model():
+    tokenizer = AutoTokenizer.from_pretrained(EMBEDDING_MODEL)
+    model = ORTModelForFeatureExtraction.from_pretrained(
+        EMBEDDING_MODEL, export=True, provider="CPUExecutionProvider"
+    )
+    return tokenizer, model
+
+
+def _mean_pool(token_embeddings, attention_mask):
+    mask = np.expand_dims(attention_mask, -1).astype(np.float32)
+    summed = (token_embeddings * mask).sum(axis=1)
+    counts = np.clip(mask.sum(axis=1), 1e-9, None)
+    return summed / counts
+
+
+class LocalMiniLMEmbedder(BaseEmbedder):
+    """Embeds text locally with all-MiniLM-L6-v2 via ONNX Runtime.
+
+    Replaces the HuggingFace Inference API embedder: each remote request
+    costs 100-300 ms of HTTPS latency per call, while local CPU inference
+    on this 384-d model takes a few ms per batch and needs no API key.
+    """
+
+    def __init__(self, config: Optional[BaseEmbedderConfig] = None):
+        super().__init__(config=config)
+        tokenizer, model = _load_onnx_model()
+
+        def embedding_fn(texts):
+            encoded = tokenizer(texts, padding=True, truncation=True, return_tensors="np")
+            outputs = model(**encoded)
+            embeddings = _mean_pool(outputs.last_hidden_state, encoded["attention_mask"])
+            norms = np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-9, None)
+            return (embeddings / norms).tolist()
+
+        self.set_embedding_fn(embedding_fn=embedding_fn)
+        self.set_vector_dimension(vector_dimension=EMBEDDING_DIM)
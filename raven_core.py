@@ -0,0 +1,521 @@
+"""Shared core for the Raven chat pages.
+
+app.py and gemini_pdf_chat.py were near-identical scripts; keeping the
+logic here means one import tree, one model/tokenizer cache, and one
+HTTP client per process when both pages are loaded. Pages call
+build_app(provider, api_key) and run_chat_page(...).
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import diskcache
+import streamlit as st
+
+from embedchain import App
+from embedchain.config import BaseLlmConfig
+from google import genai
+from google.genai import types as genai_types
+from langchain.callbacks.base import BaseCallbackHandler
+from cachetools import TTLCache
+
+from faiss_db import FaissDB, FaissDBConfig
+
+GEMINI_MODEL = "gemini-1.5-flash"
+
+# Number of chunks sent per embedding API request.
+EMBED_BATCH_SIZE = 64
+
+# L1 response cache; the on-disk L2 below survives process restarts.
+response_cache = TTLCache(maxsize=100, ttl=300)
+
+# Marks the end of a streamed response on the token queue.
+_SENTINEL = object()
+
+# Throttle streaming re-renders: each markdown call re-sends the whole
+# response to the browser, so flush at most every 16 tokens or 50 ms.
+_FLUSH_TOKENS = 16
+_FLUSH_INTERVAL = 0.05
+
+# Extracts the original file name from a citation source path.
+_PDF_SOURCE_RE = re.compile(r"([^/]+)\.[^\.]+\.pdf$")
+
+# Provider-specific LLM settings merged into the shared config at build time.
+_LLM_CONFIGS = {
+    "huggingface": {
+        "model": "mistralai/Mistral-7B-Instruct-v0.2",
+        "temperature": 0.7,
+        "max_tokens": 2048,
+        "top_p": 1,
+        "stream": True,
+    },
+    "gemini": {
+        "model": GEMINI_MODEL,
+        "temperature": 0.7,
+        "max_tokens": 2048,
+        "top_p": 1,
+        "stream": True,
+    },
+}
+
+_EMBEDDER_CONFIGS = {
+    "huggingface": {"provider": "huggingface", "config": {}},
+    "gemini": {"provider": "gemini", "config": {"model": "embedding-001"}},
+}
+
+
+@st.cache_resource
+def _get_l2_response_cache(db_path: str):
+    return diskcache.Cache(os.path.join(db_path, "resp"))
+
+
+def _response_cache_key(prompt, app):
+    """Key responses on the prompt plus the retrieved context, so cached
+    answers are invalidated when newly ingested documents change retrieval."""
+    results = app.search(prompt, num_documents=5)
+    context = "".join(sorted(result["context"] for result in results))
+    return hashlib.sha256(f"{prompt}|{context}".encode()).hexdigest()
+
+
+def get_genai_client(api_key):
+    if "genai_client" not in st.session_state:
+        st.session_state.genai_client = genai.Client(api_key=api_key)
+    return st.session_state.genai_client
+
+
+class _SyncToAsyncQueueIterator:
+    """Async-iterates tokens pushed from a sync producer thread.
+
+    The producer pushes with put_threadsafe() and calls finish() when the
+    stream is exhausted; the consumer just `async for`s over the instance.
+    """
+
+    def __init__(self, loop):
+        self.q = asyncio.Queue()
+        self.loop = loop
+
+    def put_threadsafe(self, token):
+        self.loop.call_soon_threadsafe(self.q.put_nowait, token)
+
+    def finish(self):
+        self.q.put_nowait(_SENTINEL)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        token = await self.q.get()
+        if token is _SENTINEL:
+            raise StopAsyncIteration
+        return token
+
+
+class _AsyncQueueCallbackHandler(BaseCallbackHandler):
+    """Forwards streamed LLM tokens from the producer thread into the token stream."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        self.stream.put_threadsafe(token)
+
+
+def _batch_embedding_fn(embedding_fn, batch_size=EMBED_BATCH_SIZE):
+    """Wrap an embedding function so texts are embedded in fixed-size batches."""
+
+    def embed(texts):
+        vectors = []
+        for start in range(0, len(texts), batch_size):
+            vectors.extend(embedding_fn(texts[start : start + batch_size]))
+        return vectors
+
+    return embed
+
+
+def _use_batched_embedder(app):
+    app.embedding_model.embedding_fn = _batch_embedding_fn(app.embedding_model.embedding_fn)
+    return app
+
+
+def _use_faiss_db(app, db_path):
+    db = FaissDB(config=FaissDBConfig(collection_name="chat-pdf", dir=db_path))
+    db._set_embedder(app.embedding_model)
+    db._initialize()
+    app.db = db
+    return app
+
+
+@st.cache_resource
+def build_app(provider: str, api_key: str):
+    db_path = get_db_path(provider)
+    embedder = _EMBEDDER_CONFIGS[provider]
+    app = App.from_config(
+        config={
+            "llm": {"provider": provider, "config": dict(_LLM_CONFIGS[provider], api_key=api_key)},
+            "embedder": {"provider": embedder["provider"], "config": dict(embedder["config"], api_key=api_key)},
+            "chunker": {"chunk_size": 2000, "chunk_overlap": 0, "length_function": "len"},
+        }
+    )
+    if provider == "huggingface":
+        # Embed locally instead of through the HF Inference API; the remote
+        # embedder above is only instantiated, never called. Imported lazily
+        # so the Gemini page doesn't load the ONNX stack.
+        from local_embedder import LocalMiniLMEmbedder
+
+        app.embedding_model = LocalMiniLMEmbedder()
+    return _use_faiss_db(_use_batched_embedder(app), db_path)
+
+
+# Providers already warmed (or warming). Streamlit re-executes the page
+# body on every rerun, so the flag keeps it to one build per process.
+_PREWARMED = set()
+_PREWARM_LOCK = threading.Lock()
+
+
+def prewarm_app(provider, api_key):
+    """Build the cached App in a daemon thread during server boot so the
+    first prompt doesn't pay the setup cost; build_app blocks on the
+    in-flight init."""
+    with _PREWARM_LOCK:
+        if provider in _PREWARMED:
+            return
+        _PREWARMED.add(provider)
+    threading.Thread(target=lambda: build_app(provider, api_key), daemon=True).start()
+
+
+def get_db_path(provider):
+    # Partitioned per provider: the two pages embed at different dimensions
+    # (384-d local MiniLM vs 768-d embedding-001), so they must not share a
+    # FAISS index, hash registry, or response cache.
+    db_path = os.path.join(tempfile.gettempdir(), "raven-chroma", provider)
+    os.makedirs(db_path, exist_ok=True)
+    return db_path
+
+
+# Guards the hash registry: ingestion runs on executor threads, so the
+# read-modify-write of added_docs.json must be serialized, and the cache
+# lives at module level because worker threads have no ScriptRunContext
+# (st.session_state there is a throwaway).
+_REGISTRY_LOCK = threading.Lock()
+_ADDED_HASHES = {}
+
+# embedchain's add() shares one SQLAlchemy metadata session plus chunker
+# and dedup state across calls, none of it synchronized, so the add itself
+# must be serialized; only the file write and hashing run in parallel.
+_APP_ADD_LOCK = threading.Lock()
+
+
+def _load_added_hashes(db_path):
+    # Caller must hold _REGISTRY_LOCK.
+    if db_path not in _ADDED_HASHES:
+        registry = os.path.join(db_path, "added_docs.json")
+        if os.path.exists(registry):
+            with open(registry) as f:
+                _ADDED_HASHES[db_path] = json.load(f)
+        else:
+            _ADDED_HASHES[db_path] = {}
+    return _ADDED_HASHES[db_path]
+
+
+def _hash_already_added(db_path, doc_hash):
+    with _REGISTRY_LOCK:
+        return doc_hash in _load_added_hashes(db_path)
+
+
+def _record_added_hash(db_path, doc_hash, file_name):
+    with _REGISTRY_LOCK:
+        added_hashes = _load_added_hashes(db_path)
+        added_hashes[doc_hash] = file_name
+        with open(os.path.join(db_path, "added_docs.json"), "w") as f:
+            json.dump(added_hashes, f)
+
+
+def _write_pdf_tempfile(pdf_file):
+    """Write the upload to a named temp file and return its path.
+
+    The name must carry the upload's file name and a .pdf suffix:
+    embedchain records the path as the chunk source, which the Sources
+    footer parses back into the original file name via _PDF_SOURCE_RE.
+    """
+    with tempfile.NamedTemporaryFile(
+        mode="wb", delete=False, prefix=pdf_file.name, suffix=".pdf"
+    ) as f:
+        f.write(pdf_file.getbuffer())
+        return f.name
+
+
+def add_pdf_to_knowledge_base(pdf_file, app, provider):
+    file_name = pdf_file.name
+    db_path = get_db_path(provider)
+    doc_hash = hashlib.sha256(pdf_file.getbuffer()).hexdigest()
+    if _hash_already_added(db_path, doc_hash):
+        return f"{file_name} is already in the knowledge base!"
+    temp_path = None
+    try:
+        temp_path = _write_pdf_tempfile(pdf_file)
+        with _APP_ADD_LOCK:
+            app.add(temp_path, data_type="pdf_file")
+        _record_added_hash(db_path, doc_hash, file_name)
+        return f"Added {file_name} to knowledge base!"
+    except Exception as e:
+        return f"Error adding {file_name} to knowledge base: {e}"
+    finally:
+        if temp_path is not None:
+            os.remove(temp_path)
+
+
+def add_link_to_knowledge_base(link, app):
+    try:
+        with _APP_ADD_LOCK:
+            app.add(link, data_type="link")
+        return f"Added {link} to knowledge base!"
+    except Exception as e:
+        return f"Error adding {link} to knowledge base: {e}"
+
+
+def add_youtube_to_knowledge_base(youtube_link, app):
+    try:
+        with _APP_ADD_LOCK:
+            app.add(youtube_link, data_type="youtube")
+        return f"Added YouTube link {youtube_link} to knowledge base!"
+    except Exception as e:
+        return f"Error adding YouTube link {youtube_link} to knowledge base: {e}"
+
+
+def display_messages():
+    for message in st.session_state.messages:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+
+
+async def _render_stream(tokens, msg_placeholder):
+    parts = []
+    pending = 0
+    last_flush = time.monotonic()
+    async for token in tokens:
+        parts.append(token)
+        pending += 1
+        now = time.monotonic()
+        if pending >= _FLUSH_TOKENS or now - last_flush >= _FLUSH_INTERVAL:
+            msg_placeholder.markdown("".join(parts))
+            pending = 0
+            last_flush = now
+    full_response = "".join(parts)
+    msg_placeholder.markdown(full_response)
+    return full_response
+
+
+def _llm_config_with_callbacks(app, callbacks):
+    """Per-prompt config: validated once per app (not globally, the module
+    serves multiple providers) and shallow-copied with only callbacks swapped."""
+    base = getattr(app, "_base_llm_config", None)
+    if base is None:
+        base = BaseLlmConfig(**app.llm.config.as_dict())
+        app._base_llm_config = base
+    config = copy.copy(base)
+    config.callbacks = callbacks
+    return config
+
+
+async def _stream_embedchain_response(prompt, app, msg_placeholder):
+    loop = asyncio.get_running_loop()
+    stream = _SyncToAsyncQueueIterator(loop)
+
+    config = _llm_config_with_callbacks(app, [_AsyncQueueCallbackHandler(stream)])
+
+    chat_future = loop.run_in_executor(None, lambda: app.chat(prompt, config=config, citations=True))
+    chat_future.add_done_callback(lambda _: stream.finish())
+
+    full_response = await _render_stream(stream, msg_placeholder)
+    answer, citations = await chat_future
+    return full_response, citations
+
+
+async def _stream_gemini_response(prompt, app, api_key, msg_placeholder):
+    results = app.search(prompt, num_documents=5)
+    context = "\n\n".join(result["context"] for result in results)
+    citations = [(result["context"], result["metadata"]) for result in results]
+
+    contents = (
+        "Use the following context to answer the query at the end. "
+        "If the context is empty or not relevant, answer from your own knowledge.\n\n"
+        f"{context}\n\nQuery: {prompt}"
+    )
+
+    client = get_genai_client(api_key)
+    # Mirror the declared LLM settings; the direct call bypasses the
+    # embedchain Gemini LLM they are configured on.
+    llm_config = _LLM_CONFIGS["gemini"]
+    generation_config = genai_types.GenerateContentConfig(
+        temperature=llm_config["temperature"],
+        top_p=llm_config["top_p"],
+        max_output_tokens=llm_config["max_tokens"],
+    )
+
+    async def tokens():
+        async for chunk in await client.aio.models.generate_content_stream(
+            model=GEMINI_MODEL, contents=contents, config=generation_config
+        ):
+            if chunk.text:
+                yield chunk.text
+
+    full_response = await _render_stream(tokens(), msg_placeholder)
+    return full_response, citations
+
+
+def process_user_input(prompt, app, provider, api_key):
+    with st.chat_message("user"):
+        st.session_state.messages.append({"role": "user", "content": prompt})
+        st.markdown(prompt)
+
+    cache_key = _response_cache_key(prompt, app)
+    l2_cache = _get_l2_response_cache(get_db_path(provider))
+    response = response_cache.get(cache_key) or l2_cache.get(cache_key)
+    if response:
+        response_cache[cache_key] = response
+        with st.chat_message("assistant"):
+            st.markdown(response)
+            st.session_state.messages.append({"role": "assistant", "content": response})
+        return
+
+    with st.chat_message("assistant"):
+        msg_placeholder = st.empty()
+        msg_placeholder.markdown("Thinking...")
+
+        if provider == "gemini":
+            full_response, citations = asyncio.run(
+                _stream_gemini_response(prompt, app, api_key, msg_placeholder)
+            )
+        else:
+            full_response, citations = asyncio.run(
+                _stream_embedchain_response(prompt, app, msg_placeholder)
+            )
+
+        if citations:
+            full_response += "\n\n**Sources**:\n"
+            sources = []
+            for citation in citations:
+                source = citation[1]["url"]
+                match = _PDF_SOURCE_RE.search(source)
+                if match:
+                    source = match.group(1) + ".pdf"
+                sources.append(source)
+            full_response += "".join(f"- {source}\n" for source in dict.fromkeys(sources))
+
+        msg_placeholder.markdown(full_response)
+        st.session_state.messages.append({"role": "assistant", "content": full_response})
+
+        # Cache the response in both tiers
+        response_cache[cache_key] = full_response
+        l2_cache[cache_key] = full_response
+
+
+def _render_feedback_form():
+    """Feedback on the latest answer, rendered on every rerun.
+
+    The form must live outside process_user_input: submitting it triggers
+    a rerun without a new prompt, and the form has to exist on that rerun
+    for the submit branch to execute. st.form still batches the widget
+    state into a single rerun at submit.
+    """
+    if not any(message["role"] == "user" for message in st.session_state.messages):
+        return
+    last_answer = max(
+        index
+        for index, message in enumerate(st.session_state.messages)
+        if message["role"] == "assistant"
+    )
+    with st.form(key=f"feedback_{last_answer}"):
+        feedback = st.radio("Was this answer helpful?", ["Yes", "No"], horizontal=True)
+        details = st.text_input("What was wrong with the answer?")
+        if st.form_submit_button("Submit Feedback"):
+            st.session_state.setdefault("feedback", []).append(
+                {
+                    "message_index": last_answer,
+                    "helpful": feedback == "Yes",
+                    "details": details,
+                }
+            )
+
+
+def clear_chat_history():
+    st.session_state.messages = []
+
+
+def run_chat_page(provider, caption, welcome, api_key=None, allow_links=False):
+    """Render a Raven chat page for the given provider.
+
+    When api_key is None the sidebar asks the user for a Gemini key;
+    allow_links adds the website/YouTube ingestion inputs.
+    """
+    st.title("Chat with Raven 🤖")
+    st.markdown(caption, unsafe_allow_html=True)
+
+    if "messages" not in st.session_state:
+        st.session_state.messages = [{"role": "assistant", "content": welcome}]
+
+    with st.sidebar:
+        if api_key is None:
+            st.text_input("Gemini API Key", key="api_key", type="password")
+            "WE DO NOT STORE YOUR GEMINI KEY."
+            "Just paste your Gemini API key here and we'll use it to power the chatbot."
+            api_key = st.session_state.api_key
+
+        app = build_app(provider, api_key) if api_key else None
+
+        pdf_files = st.file_uploader("Upload your PDF files", accept_multiple_files=True, type="pdf")
+        add_pdf_files = st.session_state.setdefault("add_pdf_files", set())
+
+        pending_pdfs = [pdf_file for pdf_file in pdf_files if pdf_file.name not in add_pdf_files]
+        if pending_pdfs:
+            if app is None:
+                st.error("Please enter your Gemini API Key")
+                st.stop()
+            # Embedding is network-bound, so ingest uploaded PDFs concurrently.
+            with ThreadPoolExecutor(max_workers=min(8, len(pending_pdfs))) as executor:
+                futures = {
+                    executor.submit(add_pdf_to_knowledge_base, pdf_file, app, provider): pdf_file.name
+                    for pdf_file in pending_pdfs
+                }
+                for future in as_completed(futures):
+                    file_name = futures[future]
+                    message = future.result()
+                    st.markdown(message)
+                    if "Error" not in message:
+                        add_pdf_files.add(file_name)
+                        st.session_state.messages.append({"role": "assistant", "content": message})
+
+        st.button("Clear Chat History", on_click=clear_chat_history)
+
+        if allow_links and app is not None:
+            link = st.text_input("Enter your link")
+            if link:
+                message = add_link_to_knowledge_base(link, app)
+                st.markdown(message)
+                if "Error" not in message:
+                    st.session_state.messages.append({"role": "assistant", "content": message})
+
+            youtube_link = st.text_input("Enter your YouTube link")
+            if youtube_link:
+                message = add_youtube_to_knowledge_base(youtube_link, app)
+                st.markdown(message)
+                if "Error" not in message:
+                    st.session_state.messages.append({"role": "assistant", "content": message})
+
+    display_messages()
+
+    if prompt := st.chat_input("Ask me anything!"):
+        if app is None:
+            st.error("Please enter your Gemini API Key", icon="🤖")
+            st.stop()
+        process_user_input(prompt, app, provider, api_key)
+
+    _render_feedback_form()